@@ -38,10 +38,21 @@ import os.path
 import wx
 import os
 import sys
-from subprocess import Popen, PIPE
-from threading import Thread, Event
-from queue import Queue, Empty
+import codecs
+import select
+import selectors
+from subprocess import Popen, PIPE, TimeoutExpired
+from threading import Thread, Event, Lock
+from collections import deque
 import time
+import weakref
+
+# Optional io_uring support for servicing subprocess pipes on Linux. Purely
+# opportunistic, everything works fine without it.
+try:
+    import liburing
+except (ImportError, OSError):
+    liburing = None
 
 # Aliases so we don't need to explicitly import `wx`.
 EXEC_ASYNC = wx.EXEC_ASYNC
@@ -70,30 +81,95 @@ KILL_ACCESS_DENIED = wx.KILL_ACCESS_DENIED
 KILL_NO_PROCESS = wx.KILL_NO_PROCESS
 KILL_ERROR = wx.KILL_ERROR
 
-# PIPE_READER_POLL_INTERVAL = 0.025  # seconds
+# Largest number of bytes pulled off a pipe per `os.read` call. One bulk read
+# replaces the per-line `readline` round-trips for chatty subprocesses.
+PIPE_READ_CHUNK_SIZE = 65536
+
+# Coalescing thresholds for dispatching pipe data to callbacks. A `CallAfter`
+# is only posted once this much text is pending, or this much time has passed
+# since the last post, whichever comes first. Keeps chatty subprocesses from
+# flooding the wx event queue with one tiny callback per poll.
+CALLBACK_DISPATCH_MIN_CHARS = 4096
+CALLBACK_DISPATCH_INTERVAL = 0.05  # seconds
+
+# Interval (milliseconds) at which the shared timer polls active jobs.
+SHARED_POLL_INTERVAL_MS = 50
+
+# Can we drive pipe I/O through io_uring? Checked once on first use since
+# probing sets up (and tears down) a real ring.
+_useIoUring = None
+
+
+def _haveIoUring():
+    """Check whether the io_uring pipe I/O backend can be used (`bool`).
+
+    Requires Linux, the optional `liburing` package, and a kernel recent
+    enough to set up a ring. The result is cached after the first call.
+    """
+    global _useIoUring
+    if _useIoUring is None:
+        if sys.platform != 'linux' or liburing is None:
+            _useIoUring = False
+        else:
+            try:  # probe by standing up (then tearing down) a small ring
+                ring = liburing.io_uring()
+                liburing.io_uring_queue_init(2, ring, 0)
+                liburing.io_uring_queue_exit(ring)
+                _useIoUring = True
+            except Exception:
+                _useIoUring = False
+
+    return _useIoUring
 
 
 class PipeReader(Thread):
-    """Thread for reading standard stream pipes. This is used by the `Job` class
-    to provide non-blocking reads of pipes.
+    """Reader for standard stream pipes. This is used by the `Job` class to
+    provide non-blocking reads of pipes.
+
+    On most platforms the module-wide :class:`_PipeMultiplexer` services the
+    pipe readers of every job, so instances are used as passive buffers and
+    never started. Only on Windows, where pipes cannot be registered with a
+    selector, does each reader run as its own thread doing blocking reads.
 
     Parameters
     ----------
     fdpipe : Any
         File descriptor for the pipe, either `Popen.stdout` or `Popen.stderr`.
+    text : bool
+        Decode data to `str` when it is read. If `False`, `read()` returns
+        raw `bytes` and the decoding cost is skipped entirely.
+    zeroCopy : bool
+        Return a `memoryview` over the internal buffer from `read()` rather
+        than copying it out to `bytes`. The view refers to a buffer the
+        reader no longer writes to, but consumers should use it promptly
+        rather than hold on to it. Requires `text=False`.
 
     """
-    def __init__(self, fdpipe):
+    def __init__(self, fdpipe, text=True, zeroCopy=False):
         # setup the `Thread` stuff
         super(PipeReader, self).__init__()
         self.daemon = True
 
+        if zeroCopy and text:
+            raise ValueError(
+                "Cannot use `zeroCopy` with `text=True`, decoding implies a "
+                "copy.")
+
         self._fdpipe = fdpipe  # pipe file descriptor
-        # queue objects for passing bytes to the main thread
-        self._queue = Queue(maxsize=1)
-        # Overflow buffer if the queue is full, prevents data loss if the
-        # application isn't reading the pipe quick enough.
-        self._overflowBuffer = []
+        self._text = text
+        self._zeroCopy = zeroCopy
+        # Accumulator for data heading to the main thread. `extend` is
+        # amortized O(1) and `read()` swaps the whole buffer out in one
+        # motion; the lock just keeps an extend from landing in a buffer
+        # mid-swap and is uncontended in practice.
+        self._buf = bytearray()
+        self._bufLock = Lock()
+        self._eof = False  # set once the pipe hits end-of-file
+        # Pipes are binary and buffered as raw bytes; `read()` decodes each
+        # drain in one shot (if `text`). The decoder is incremental so
+        # multi-byte characters split across drain boundaries come out
+        # intact.
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
         # used to signal to the thread that it's time to stop
         self._stopSignal = Event()
         self._closedSignal = Event()
@@ -101,7 +177,14 @@ class PipeReader(Thread):
     @property
     def isAvailable(self):
         """Are there bytes available to be read (`bool`)?"""
-        return self._queue.full()
+        return bool(self._buf)
+
+    @property
+    def eof(self):
+        """Has the pipe hit end-of-file (`bool`)? Once set, no more data will
+        arrive from the subprocess, though buffered data may still be unread.
+        """
+        return self._eof
 
     def read(self):
         """Read all bytes enqueued by the thread coming off the pipe. This is
@@ -110,51 +193,451 @@ class PipeReader(Thread):
 
         Returns
         -------
-        bytes
-            Most recent data passed from the subprocess since the last `read()`
-            call.
+        str or bytes
+            Most recent data passed from the subprocess since the last
+            `read()` call. Type depends on the `text` setting.
+
+        """
+        # swap the accumulator out whole rather than copying it under the
+        # lock, the reader thread just starts filling a fresh one
+        with self._bufLock:
+            if not self._buf:
+                return '' if self._text else b''
+            data = self._buf
+            self._buf = bytearray()
+
+        if not self._text:
+            # the swapped-out buffer is never written again, so a view over
+            # it saves the full-buffer copy `bytes()` would make
+            return memoryview(data) if self._zeroCopy else bytes(data)
+
+        # decode the whole drain in one go, the C-level decoder scans 64 KiB
+        # batches instead of being invoked chunk by chunk
+        return self._decoder.decode(bytes(data))
+
+    def fileno(self):
+        """File descriptor number for the pipe (`int`)."""
+        return self._fdpipe.fileno()
+
+    def drain(self):
+        """Pull a chunk of available data off the pipe into the buffer.
+
+        Reads up to `PIPE_READ_CHUNK_SIZE` bytes in one `os.read` call and
+        decodes them, one syscall per chunk instead of one per line. Called
+        by the I/O thread whenever the pipe is reported readable.
+
+        Returns
+        -------
+        bool
+            `False` once the pipe has hit EOF or been closed, meaning it no
+            longer needs to be watched.
 
         """
         try:
-            return self._queue.get_nowait()
-        except Empty:
-            return ''
+            pipeBytes = os.read(self.fileno(), PIPE_READ_CHUNK_SIZE)
+        except BlockingIOError:
+            return True  # spurious readiness, nothing to read yet
+        except (OSError, ValueError):
+            self._eof = True
+            return False  # pipe has gone away, we're done here
+
+        if not pipeBytes:  # EOF, subprocess closed its end of the pipe
+            self._eof = True
+            return False
+
+        self.feed(pipeBytes)
+
+        return True
+
+    def feed(self, pipeBytes):
+        """Buffer raw bytes already pulled off the pipe.
+
+        Used by I/O backends which read on the reader's behalf (e.g. io_uring
+        completions carry the data with them), and by `drain()` itself. Bytes
+        are kept raw here and only decoded when the consumer calls `read()`.
+
+        Parameters
+        ----------
+        pipeBytes : bytes
+            Raw data read from the pipe.
+
+        """
+        # Extend the accumulator, `read()` drains everything in one go. The
+        # extend is amortized O(1), so the main thread falling behind just
+        # grows the buffer rather than costing a copy per chunk.
+        with self._bufLock:
+            self._buf.extend(pipeBytes)
 
     def run(self):
         """Payload routine for the thread. This reads bytes from the pipe and
-        enqueues them.
-        """
-        # read bytes in chunks until EOF
-        for pipeBytes in iter(self._fdpipe.readline, b''):
-            # put bytes into the queue, handle overflows if the queue is full
-            if not self._queue.full():
-                # we have room, check if we have a backlog of bytes to send
-                if self._overflowBuffer:
-                    pipeBytes = "".join(self._overflowBuffer) + pipeBytes
-                    self._overflowBuffer = []  # clear the overflow buffer
-
-                # write bytes to the queue
-                self._queue.put(pipeBytes)
-            else:
-                # Put bytes into buffer if the queue hasn't been emptied quick
-                # enough. These bytes will be passed along once the queue has
-                # space.
-                self._overflowBuffer.append(pipeBytes)
-
-            if self._stopSignal.is_set():
+        enqueues them. Only used on Windows where the reader runs as its own
+        thread, blocking in `os.read` until data arrives or the subprocess
+        closes the pipe.
+        """
+        while not self._stopSignal.is_set():
+            if not self.drain():
                 break
 
+        if self._eof:
+            self.close()  # free the kernel pipe buffer right away
+
         self._closedSignal.set()
 
+    def close(self):
+        """Close the pipe file object, releasing its kernel buffer. Safe to
+        call more than once."""
+        try:
+            self._fdpipe.close()
+        except OSError:
+            pass
+
     def stop(self):
         """Call this to signal the thread to stop reading bytes."""
         self._stopSignal.set()
-        while not self._closedSignal.is_set():
+        while self.is_alive():
             time.sleep(0.01)
 
         return self._fdpipe
 
 
+class _PipeMultiplexer(Thread):
+    """Module-wide thread servicing the pipes of every active `Job`.
+
+    A `selectors.DefaultSelector` (epoll/kqueue under the hood) multiplexes
+    the subprocess `stdout` and `stderr` pipes of all running jobs, so a
+    single blocking wait covers every reader and the thread only wakes when
+    the kernel reports data. With one Job this behaves like the previous
+    per-job thread; with ten it still costs one thread instead of ten,
+    amortizing scheduler wakeups across all of them.
+
+    Registrations may come from any thread: requests are queued and the
+    selector woken through an eventfd (or self-pipe on platforms without
+    one), then applied on this thread before the next wait. A job's pidfd
+    can also be watched, setting the supplied `Event` when the child exits
+    so `Job.poll` can check a flag instead of calling `waitpid`.
+
+    Use `getInstance()` rather than constructing directly; a single daemon
+    instance (started on first use) serves the whole process and blocks with
+    zero CPU when idle. Not usable on Windows, where pipes cannot be
+    registered with a selector.
+    """
+    _instance = None
+    _instanceLock = Lock()
+
+    def __init__(self):
+        super(_PipeMultiplexer, self).__init__()
+        self.daemon = True
+
+        self._ops = deque()  # pending registration requests, see `_post`
+        self._stopSignal = Event()
+        # Wake-up descriptor to interrupt the wait when a registration
+        # arrives or `stop()` is called. An eventfd is cheaper than a pipe
+        # in the kernel and needs only one fd, so use it where available
+        # (Linux, Python 3.10+); elsewhere a self-pipe does the same job.
+        if hasattr(os, 'eventfd'):
+            self._wakeReadFd = self._wakeWriteFd = os.eventfd(
+                0, os.EFD_NONBLOCK)
+        else:
+            self._wakeReadFd, self._wakeWriteFd = os.pipe()
+
+    @classmethod
+    def getInstance(cls):
+        """Get the multiplexer serving this process, starting it on first
+        use (`_PipeMultiplexer`). Uses the io_uring variant when available.
+        """
+        with cls._instanceLock:
+            if cls._instance is None or not cls._instance.is_alive():
+                muxClass = (
+                    _UringPipeMultiplexer if _haveIoUring()
+                    else _PipeMultiplexer)
+                cls._instance = muxClass()
+                cls._instance.start()
+
+            return cls._instance
+
+    def register(self, reader):
+        """Start servicing a pipe reader. May be called from any thread."""
+        self._post('register', reader)
+
+    def unregister(self, reader):
+        """Stop servicing a pipe reader. A no-op if the pipe already hit
+        EOF and was dropped. May be called from any thread.
+        """
+        self._post('unregister', reader)
+
+    def watchPidfd(self, pidfd, exitSignal):
+        """Watch a pidfd (see `os.pidfd_open`) and set `exitSignal` when it
+        reports the child has exited. Takes ownership of the descriptor and
+        closes it. May be called from any thread.
+        """
+        self._post('watchpid', (pidfd, exitSignal))
+
+    def _post(self, verb, obj):
+        """Queue a registration request and wake the servicing thread."""
+        self._ops.append((verb, obj))
+        self._wake()
+
+    def _wake(self):
+        """Interrupt the blocking wait so queued requests get applied."""
+        try:
+            if self._wakeWriteFd == self._wakeReadFd:  # eventfd
+                os.eventfd_write(self._wakeWriteFd, 1)
+            else:
+                os.write(self._wakeWriteFd, b'\0')
+        except OSError:
+            pass  # thread already exited and closed the wake-up fd
+
+    def _closeWakeFds(self):
+        """Close the wake-up descriptor(s)."""
+        os.close(self._wakeReadFd)
+        if self._wakeWriteFd != self._wakeReadFd:  # self-pipe has two fds
+            os.close(self._wakeWriteFd)
+
+    def _applyPending(self, selector):
+        """Apply queued registration requests to the selector. Runs on the
+        servicing thread only.
+        """
+        while self._ops:
+            verb, obj = self._ops.popleft()
+            try:
+                if verb == 'register':
+                    fd = obj.fileno()
+                    os.set_blocking(fd, False)
+                    selector.register(fd, selectors.EVENT_READ, ('pipe', obj))
+                elif verb == 'unregister':
+                    selector.unregister(obj.fileno())
+                elif verb == 'watchpid':
+                    # a pidfd becomes readable exactly once, on child exit
+                    selector.register(
+                        obj[0], selectors.EVENT_READ, ('pidfd', obj))
+            except (KeyError, OSError, ValueError):
+                continue  # fd already closed or never registered
+
+    def run(self):
+        """Payload routine for the thread. Waits on every registered pipe at
+        once and drains whichever have data, dropping pipes as they hit EOF,
+        until `stop()` is called (normally never, the thread idles with the
+        process).
+        """
+        selector = selectors.DefaultSelector()
+        os.set_blocking(self._wakeReadFd, False)
+        selector.register(
+            self._wakeReadFd, selectors.EVENT_READ, ('wake', None))
+
+        try:
+            while not self._stopSignal.is_set():
+                self._applyPending(selector)
+                for key, _ in selector.select():
+                    kind, obj = key.data
+                    if kind == 'wake':  # new registrations or `stop()`
+                        os.read(self._wakeReadFd, PIPE_READ_CHUNK_SIZE)
+                        continue
+
+                    if kind == 'pidfd':  # child has exited
+                        pidfd, exitSignal = obj
+                        exitSignal.set()
+                        selector.unregister(pidfd)
+                        os.close(pidfd)
+                        continue
+
+                    reader = obj
+                    if not reader.drain():  # EOF, stop watching this pipe
+                        selector.unregister(key.fileobj)
+                        reader.close()  # free the kernel pipe buffer now
+        finally:
+            selector.close()
+            self._closeWakeFds()
+
+    def stop(self):
+        """Signal the thread to stop and wait for it to exit. Only needed
+        for tests and interpreter shutdown; the instance normally idles for
+        the life of the process.
+        """
+        self._stopSignal.set()
+        self._wake()
+        self.join(timeout=1.)
+
+
+class _UringPipeMultiplexer(_PipeMultiplexer):
+    """Variant of `_PipeMultiplexer` driven by io_uring instead of a
+    selector.
+
+    Reads on every watched pipe are armed in the ring and re-armed as their
+    completions drain, so a completion already carries its data and
+    servicing N busy pipes costs one wait per batch of completions rather
+    than a readiness-then-read pair of syscalls each. The `liburing` binding
+    used here only exposes single-shot reads (no multishot or deferred task
+    running), so each completion re-submits its read. Unregistered pipes are
+    simply not re-armed, as single-shot reads cannot be cancelled portably.
+
+    Only constructed when `_haveIoUring()` reports support; `getInstance()`
+    falls back to the selector variant otherwise.
+    """
+    def run(self):
+        """Payload routine for the thread. Waits on the ring and feeds
+        completed reads to their readers, re-arming pipes until they hit
+        EOF or are unregistered.
+        """
+        ring = liburing.io_uring()
+        liburing.io_uring_queue_init(32, ring, 0)
+        # in-flight operations keyed by fd; read buffers are kept referenced
+        # here while the kernel may still write to them
+        pending = {}
+        dropped = set()  # fds unregistered while a read was in flight
+
+        def getSqe():
+            # the submission queue holds 32 entries, which a burst of
+            # registrations (3 per starting job) can fill before the loop
+            # submits; flush it rather than prep into a null SQE
+            sqe = liburing.io_uring_get_sqe(ring)
+            if not sqe:
+                liburing.io_uring_submit(ring)
+                sqe = liburing.io_uring_get_sqe(ring)
+
+            return sqe
+
+        def armRead(fd, data):
+            sqe = getSqe()
+            buf = bytearray(PIPE_READ_CHUNK_SIZE)
+            iov = liburing.iovec(buf)
+            liburing.io_uring_prep_readv(sqe, fd, iov, 1, 0)
+            sqe.user_data = fd
+            pending[fd] = (buf, iov, data)
+
+        def applyPending():
+            while self._ops:
+                verb, obj = self._ops.popleft()
+                try:
+                    if verb == 'register':
+                        armRead(obj.fileno(), ('pipe', obj))
+                    elif verb == 'unregister':
+                        dropped.add(obj.fileno())
+                    elif verb == 'watchpid':
+                        # pidfds only report readiness (they cannot be
+                        # read), so arm a poll rather than a read; it
+                        # completes once, when the child exits
+                        sqe = getSqe()
+                        liburing.io_uring_prep_poll_add(
+                            sqe, obj[0], select.POLLIN)
+                        sqe.user_data = obj[0]
+                        pending[obj[0]] = (None, None, ('pidfd', obj))
+                except (OSError, ValueError):
+                    continue  # fd already closed
+
+        armRead(self._wakeReadFd, ('wake', None))
+
+        cqe = liburing.io_uring_cqe()
+        try:
+            while not self._stopSignal.is_set():
+                applyPending()
+                liburing.io_uring_submit(ring)
+                liburing.io_uring_wait_cqe(ring, cqe)
+                fd = cqe.user_data
+                nRead = cqe.res
+                liburing.io_uring_cqe_seen(ring, cqe)
+
+                buf, _, data = pending.pop(fd, (None, None, ('wake', None)))
+                kind, obj = data
+                if kind == 'wake':  # new registrations or `stop()`
+                    armRead(self._wakeReadFd, ('wake', None))
+                    continue
+
+                if kind == 'pidfd':  # child has exited
+                    pidfd, exitSignal = obj
+                    exitSignal.set()
+                    os.close(pidfd)
+                    continue
+
+                reader = obj
+                if fd in dropped:  # unregistered mid-flight, don't re-arm
+                    dropped.discard(fd)
+                    continue
+
+                if nRead <= 0:  # EOF or error, stop watching this pipe
+                    reader._eof = True
+                    reader.close()  # free the kernel pipe buffer now
+                    continue
+
+                reader.feed(bytes(buf[:nRead]))
+                armRead(fd, ('pipe', reader))  # re-arm for the next chunk
+        except Exception:
+            # The binding is optional and only probe-validated, so any
+            # unexpected error here means the backend cannot be trusted.
+            # Hand everything still being watched to a selector multiplexer
+            # rather than dying with it: registered jobs would otherwise
+            # hang silently, their pipes never draining and their exit
+            # signals never set.
+            self._failover(pending, dropped)
+        finally:
+            try:
+                liburing.io_uring_queue_exit(ring)
+            except Exception:
+                pass  # ring may be in an undefined state after a failure
+            self._closeWakeFds()
+
+    def _failover(self, pending, dropped):
+        """Replace this multiplexer with the selector variant after an
+        unexpected failure, re-registering every pipe and pidfd still being
+        watched. Also clears the io_uring capability cache so later
+        instances stay off this backend.
+        """
+        global _useIoUring
+        with _PipeMultiplexer._instanceLock:
+            _useIoUring = False
+            replacement = _PipeMultiplexer()
+            _PipeMultiplexer._instance = replacement
+            replacement.start()
+
+        for fd, (_, _, data) in pending.items():
+            kind, obj = data
+            if fd in dropped:
+                continue  # was unregistered while its read was in flight
+            if kind == 'pipe' and not obj.eof:
+                replacement.register(obj)
+            elif kind == 'pidfd':
+                replacement.watchPidfd(*obj)
+
+        while self._ops:  # forward requests queued but never applied here
+            replacement._post(*self._ops.popleft())
+
+
+class _SharedPollTimer(wx.Timer):
+    """Single timer which drives `poll()` for every active `Job`.
+
+    With one `wx.Timer` per job, K running jobs meant K timer wakeups
+    jittered across the event loop per interval. Registering them all with
+    one shared timer drains every job's pipes in a single tick. Jobs are
+    held weakly so a collected job simply drops out of the rotation.
+    """
+    def __init__(self):
+        super(_SharedPollTimer, self).__init__()
+        self._jobs = weakref.WeakSet()
+
+    def register(self, job):
+        """Add a job to be polled each tick, starting the timer if needed."""
+        self._jobs.add(job)
+        if not self.IsRunning():
+            self.Start(SHARED_POLL_INTERVAL_MS, oneShot=wx.TIMER_CONTINUOUS)
+
+    def unregister(self, job):
+        """Remove a job from the polling rotation, stopping the timer once
+        no jobs remain so an idle application gets no timer wakeups at all.
+        """
+        self._jobs.discard(job)
+        if not self._jobs and self.IsRunning():
+            self.Stop()
+
+    def Notify(self):
+        """Called each timer tick, polls every registered job."""
+        for job in tuple(self._jobs):
+            job.poll()
+
+        # jobs are held weakly, so the set can empty without an explicit
+        # `unregister` if a job was garbage collected
+        if not self._jobs and self.IsRunning():
+            self.Stop()
+
+
 class Job:
     """General purpose class for running subprocesses using wxPython's
     subprocess framework. This class should only be instanced and used if the
@@ -178,6 +661,16 @@ class Job:
     extra : dict or None
         Dict of extra variables to be accessed by callback functions, use None
         for a blank dict.
+    text : bool
+        Decode pipe data to `str` before passing it to callbacks. If `False`,
+        callbacks receive raw `bytes` and no decoding is done on the hot
+        path, useful when output is just being forwarded to a log file.
+    zeroCopy : bool
+        Pass callbacks a `memoryview` over the reader's buffer instead of a
+        `bytes` copy, saving one full-buffer copy per drain. Callbacks should
+        consume (or copy) the view promptly rather than hold on to it. Only
+        valid together with `text=False`, and dispatches are not coalesced
+        in this mode since batching would itself copy.
 
     Examples
     --------
@@ -191,20 +684,29 @@ class Job:
         pid = job.start()  # returns a PID for the sub process
 
     """
+    # timer shared by all jobs, created on the first `start()` call
+    _sharedPollTimer = None
+
     def __init__(self, parent, command='', terminateCallback=None,
-                 inputCallback=None, errorCallback=None, extra=None):
+                 inputCallback=None, errorCallback=None, extra=None,
+                 text=True, zeroCopy=False):
         # use the app instance if parent isn't given
         if parent is None:
             from psychopy.app import getAppInstance
             parent = getAppInstance()
         # command to be called, cannot be changed after spawning the process
+        if zeroCopy and text:
+            raise ValueError(
+                "Cannot use `zeroCopy` with `text=True`, decoding implies a "
+                "copy.")
+
         self.parent = parent
         self._command = command
+        self._text = text
+        self._zeroCopy = zeroCopy
         self._pid = None
         # self._flags = flags  # unused right now
         self._process = None
-        # self._pollMillis = None
-        # self._pollTimer = wx.Timer()
 
         # user defined callbacks
         self._inputCallback = None
@@ -218,9 +720,22 @@ class Job:
             extra = {}
         self.extra = extra
 
-        # non-blocking pipe reading threads and FIFOs
+        # non-blocking pipe readers and multiplexer bookkeeping
         self._stdoutReader = None
         self._stderrReader = None
+        self._usingMux = False
+        # set by the multiplexer when a watched pidfd reports child exit,
+        # `None` when no pidfd could be watched
+        self._childExitedSignal = None
+        self._exitWatcher = None  # multiplexer watching the pidfd
+        # whether `poll()` has already done its one timed wait after both
+        # pipes hit EOF, see there
+        self._eofWaitDone = False
+
+        # pending data awaiting dispatch to callbacks, see `_readPipes()`
+        self._pendingStdout = '' if text else b''
+        self._pendingStderr = '' if text else b''
+        self._lastDispatchTime = 0.0
 
     def start(self, cwd=None, env=None):
         """Start the subprocess.
@@ -267,21 +782,25 @@ class Job:
             scriptEnv['PYTHONLEGACYWINDOWSSTDIO'] = 'utf-8'
 
         try:
+            # Keep this call eligible for CPython's vfork/posix_spawn fast
+            # path (CPython 3.10+): no `preexec_fn`, `shell=False`, args as a
+            # list and no extra fds passed down. That avoids fork() having to
+            # duplicate the parent's page tables for every spawn, which adds
+            # up when launching many short-lived jobs.
             self._process = Popen(
                 args=command,
-                bufsize=1,
+                bufsize=PIPE_READ_CHUNK_SIZE,  # block-buffered
                 executable=None,
                 stdin=None,
                 stdout=PIPE,
                 stderr=PIPE,
-                preexec_fn=None,
                 shell=False,
                 cwd=cwd,
                 env=scriptEnv,
-                # universal_newlines=True,  # gives us back a string instead of bytes
+                close_fds=True,
+                pass_fds=(),
                 creationflags=0,
-                text=False,
-                encoding='utf-8'
+                text=False  # binary pipes, the readers handle decoding
             )
         except FileNotFoundError:
             return -1  # negative PID means failure
@@ -290,58 +809,91 @@ class Job:
         self._pid = self._process.pid
 
         # setup asynchronous readers of the subprocess pipes
-        self._stdoutReader = PipeReader(self._process.stdout)
-        self._stderrReader = PipeReader(self._process.stderr)
-        self._stdoutReader.start()
-        self._stderrReader.start()
-
-        # bind the event called when the process ends
-        # self._process.Bind(wx.EVT_END_PROCESS, self.onTerminate)
-        self.parent.Bind(wx.EVT_IDLE, self.poll)
+        self._stdoutReader = PipeReader(
+            self._process.stdout, text=self._text, zeroCopy=self._zeroCopy)
+        self._stderrReader = PipeReader(
+            self._process.stderr, text=self._text, zeroCopy=self._zeroCopy)
+        if sys.platform == 'win32':
+            # selectors can't wait on pipes here, one blocking reader thread
+            # per pipe instead
+            self._stdoutReader.start()
+            self._stderrReader.start()
+        else:
+            # hand the pipes to the module-wide multiplexer, which services
+            # every active job's pipes from a single thread
+            mux = _PipeMultiplexer.getInstance()
+            mux.register(self._stdoutReader)
+            mux.register(self._stderrReader)
+            self._usingMux = True
+
+            # Watch for child exit through a pidfd where the platform has
+            # one, so `poll()` checks a flag instead of making a `waitpid`
+            # syscall on every call.
+            self._childExitedSignal = None
+            if hasattr(os, 'pidfd_open'):
+                try:
+                    pidfd = os.pidfd_open(self._pid)
+                except OSError:
+                    pidfd = None  # kernel predates pidfds
+
+                if pidfd is not None:
+                    self._childExitedSignal = Event()
+                    self._exitWatcher = mux
+                    mux.watchPidfd(pidfd, self._childExitedSignal)
+
+        # reset callback dispatch coalescing state
+        self._pendingStdout = '' if self._text else b''
+        self._pendingStderr = '' if self._text else b''
+        self._lastDispatchTime = time.monotonic()
+        self._eofWaitDone = False
+
+        # register with the timer which polls all active jobs
+        if Job._sharedPollTimer is None:
+            Job._sharedPollTimer = _SharedPollTimer()
+        Job._sharedPollTimer.register(self)
 
         return self._pid
 
     def terminate(self):
         """Terminate the subprocess associated with this object.
 
+        This call does not block. The subprocess is signalled to exit and a
+        small watcher thread waits on it, invoking `onTerminate` on the main
+        thread (with the real return code) once it has fully died. Any data
+        already read off the pipes is flushed to callbacks first, so output
+        printed just before termination is not lost.
+
         Return
         ------
         bool
-            `True` if the terminate call was successful in ending the
-            subprocess. If `False`, something went wrong and you should try and
-            figure it out.
+            `True` if the terminate signal was sent to the subprocess. If
+            `False`, the subprocess already ended or was never started.
 
         """
         if not self.isRunning:
             return False  # nop
 
-        self.parent.Unbind(wx.EVT_IDLE)
-
-        # isOk = wx.Process.Kill(self._pid, signal, flags) is wx.KILL_OK
-        self._process.kill()  # kill the process
-        #self._pollTimer.Stop()
-
-        # Wait for the process to exit completely, return code will be incorrect
-        # if we don't.
-        if self._process is not None:
-            processStillRunning = True
-            while processStillRunning:
-                wx.Yield()  # yield to the GUI main loop
-                if self._process is None:
-                    processStillRunning = False
-                    continue
+        # stop polling and flush whatever already came off the pipes
+        Job._sharedPollTimer.unregister(self)
+        self._readPipes(flush=True)
 
-                processStillRunning = self._process.poll() is None
-                time.sleep(0.1)  # sleep a bit to avoid CPU over-utilization
+        process = self._process
+        try:
+            process.terminate()
+        except OSError:
+            return False  # already gone
 
-            # get the return code of the subprocess
-            retcode = self._process.returncode
-        else:
-            retcode = 0
+        # Waiting for the child to die can take a while if it handles the
+        # signal, so park the wait in a thread instead of spinning the GUI
+        # loop; `onTerminate` then runs on the main thread with the correct
+        # return code and drains anything written in the meantime.
+        def waitThenNotify():
+            retcode = process.wait()
+            wx.CallAfter(self.onTerminate, retcode)
 
-        self.onTerminate(retcode)
+        Thread(target=waitThenNotify, daemon=True).start()
 
-        return retcode is None
+        return True
 
     @property
     def command(self):
@@ -426,6 +978,7 @@ class Job:
     @inputCallback.setter
     def inputCallback(self, val):
         self._inputCallback = val
+        self._readPipesImpl = self._makeReadPipesImpl()
 
     @property
     def errorCallback(self):
@@ -437,6 +990,7 @@ class Job:
     @errorCallback.setter
     def errorCallback(self, val):
         self._errorCallback = val
+        self._readPipesImpl = self._makeReadPipesImpl()
 
     @property
     def terminateCallback(self):
@@ -449,29 +1003,6 @@ class Job:
     def terminateCallback(self, val):
         self._terminateCallback = val
 
-    # @property
-    # def pollMillis(self):
-    #     """Polling interval for input and error pipes (`int` or `None`).
-    #     """
-    #     return self._pollMillis
-
-    # @pollMillis.setter
-    # def pollMillis(self, val):
-    #     if isinstance(val, (int, float)):
-    #         self._pollMillis = int(val)
-    #     elif val is None:
-    #         self._pollMillis = None
-    #     else:
-    #         raise TypeError("Value must be must be `int` or `None`.")
-    #
-    #     if not self._pollTimer.IsRunning():
-    #         return
-    #
-    #     if self._pollMillis is None:  # if `None`, stop the timer
-    #         self._pollTimer.Stop()
-    #     else:
-    #         self._pollTimer.Start(self._pollMillis, oneShot=wx.TIMER_CONTINUOUS)
-
     #   ~~~
     #   NB - Keep these here commented until wxPython fixes the `env` bug with
     #   `wx.Execute`. Hopefully someday we can use that again and remove all
@@ -517,17 +1048,17 @@ class Job:
 
         Returns
         -------
-        str
-            Data as a string. Returns and empty string if there is no new data.
+        str or bytes
+            Data from the pipe, empty if there is no new data. Type depends
+            on the `text` setting.
 
         """
         if self._process is None:
-            return
+            return '' if self._text else b''
 
-        if self._stdoutReader.isAvailable:
-            return self._stdoutReader.read()
-
-        return ''
+        # no availability pre-check; that would race the reader thread, and
+        # a read which comes back empty costs just one lock acquire anyway
+        return self._stdoutReader.read()
 
     # @property
     # def inputStream(self):
@@ -556,17 +1087,16 @@ class Job:
 
         Returns
         -------
-        str
-            Data as a string. Returns and empty string if there is no new data.
+        str or bytes
+            Data from the pipe, empty if there is no new data. Type depends
+            on the `text` setting.
 
         """
         if self._process is None:
-            return
+            return '' if self._text else b''
 
-        if self._stderrReader.isAvailable:
-            return self._stderrReader.read()
-
-        return ''
+        # see `getInputData` for why there is no availability pre-check
+        return self._stderrReader.read()
 
     # @property
     # def errorStream(self):
@@ -579,18 +1109,112 @@ class Job:
     #
     #     return self._process.ErrorStream
 
-    def _readPipes(self):
-        """Read data available on the pipes."""
-        # get data from pipes
-        if self.isInputAvailable:
-            stdinText = self.getInputData()
+    def _dispatchPending(self, flush=False):
+        """Post pending stream data to callbacks.
+
+        Dispatches are coalesced: pending text is accumulated and a
+        `wx.CallAfter` only posted once enough has built up or enough time
+        has passed since the last post. This keeps a subprocess printing
+        many small messages from flooding the wx event queue with one tiny
+        callback per message.
+
+        Parameters
+        ----------
+        flush : bool
+            Dispatch whatever is pending immediately, ignoring the
+            coalescing thresholds. Used when the subprocess has ended.
+
+        """
+        if not (self._pendingStdout or self._pendingStderr):
+            return  # nothing to do
+
+        # hold off posting until we have a decent batch or enough time passed
+        if not flush:
+            nPending = max(
+                len(self._pendingStdout), len(self._pendingStderr))
+            tSinceLast = time.monotonic() - self._lastDispatchTime
+            if (nPending < CALLBACK_DISPATCH_MIN_CHARS and
+                    tSinceLast < CALLBACK_DISPATCH_INTERVAL):
+                return
+
+        empty = '' if self._text else b''
+        if self._pendingStdout:
             if self._inputCallback is not None:
-                wx.CallAfter(self._inputCallback, stdinText)
+                wx.CallAfter(self._inputCallback, self._pendingStdout)
+            self._pendingStdout = empty
 
-        if self.isErrorAvailable:
-            stderrText = self.getErrorData()
+        if self._pendingStderr:
             if self._errorCallback is not None:
-                wx.CallAfter(self._errorCallback, stderrText)
+                wx.CallAfter(self._errorCallback, self._pendingStderr)
+            self._pendingStderr = empty
+
+        self._lastDispatchTime = time.monotonic()
+
+    def _readPipesZeroCopy(self, flush=False):
+        """Variant of `_readPipes` for zero-copy mode. Views are handed
+        straight to callbacks since coalescing would mean concatenating,
+        which copies and defeats the point.
+        """
+        if self._inputCallback is not None:
+            stdoutData = self.getInputData()
+            if stdoutData:
+                wx.CallAfter(self._inputCallback, stdoutData)
+
+        if self._errorCallback is not None:
+            stderrData = self.getErrorData()
+            if stderrData:
+                wx.CallAfter(self._errorCallback, stderrData)
+
+    def _makeReadPipesImpl(self):
+        """Build a pipe-reading routine specialized for the callbacks in use.
+
+        Which streams need draining is fixed for as long as the callbacks
+        stay put, yet `poll()` runs every tick for the life of the process.
+        Rather than re-test callback presence each time, the returned
+        closure only contains the reads that can actually go somewhere; a
+        stream with no callback is not drained at all, its reader's buffer
+        absorbing the bytes in case a callback is set later. The impl is
+        rebuilt whenever a callback property is assigned.
+
+        Returns
+        -------
+        callable
+            Function with the same signature as `_readPipes`.
+
+        """
+        if self._zeroCopy:
+            return self._readPipesZeroCopy
+
+        haveInput = self._inputCallback is not None
+        haveError = self._errorCallback is not None
+
+        if haveInput and haveError:
+            def readPipes(flush=False):
+                self._pendingStdout += self.getInputData()
+                self._pendingStderr += self.getErrorData()
+                self._dispatchPending(flush)
+        elif haveInput:
+            def readPipes(flush=False):
+                self._pendingStdout += self.getInputData()
+                self._dispatchPending(flush)
+        elif haveError:
+            def readPipes(flush=False):
+                self._pendingStderr += self.getErrorData()
+                self._dispatchPending(flush)
+        else:
+            def readPipes(flush=False):
+                pass  # no callbacks set, nothing to drain
+
+        return readPipes
+
+    def _readPipes(self, flush=False):
+        """Read data available on the pipes and dispatch it to callbacks.
+
+        Delegates to the implementation built by `_makeReadPipesImpl` for
+        the callbacks currently set; hot paths may call `_readPipesImpl`
+        directly to skip this indirection.
+        """
+        self._readPipesImpl(flush)
 
     def poll(self, evt=None):
         """Poll input and error streams for data, pass them to callbacks if
@@ -599,16 +1223,49 @@ class Job:
         if self._process is None:  # do nothing if there is no process
             return
 
-        # poll the subprocess
-        retCode = self._process.poll()
+        # Check whether the subprocess has exited. If the multiplexer
+        # watches a pidfd this is just a flag check, and `wait()` below
+        # merely reaps a child we already know is dead; otherwise fall back
+        # to `poll()` which costs a `waitpid` syscall per call.
+        if (self._childExitedSignal is not None and
+                not self._exitWatcher.is_alive()):
+            # The thread watching the pidfd died unexpectedly, so the flag
+            # may never be set even though the child exits. Stop trusting
+            # it and take the `waitpid` path below instead of hanging.
+            self._childExitedSignal = None
+        childExited = (
+            self._childExitedSignal.is_set()
+            if self._childExitedSignal is not None else None)
+        if childExited is None:
+            retCode = self._process.poll()
+        elif childExited:
+            retCode = self._process.wait()  # returns immediately
+        else:
+            retCode = None  # still running, no syscall needed
+
+        if (retCode is None and childExited is None and
+                not self._eofWaitDone and
+                self._stdoutReader is not None and
+                self._stdoutReader.eof and self._stderrReader.eof):
+            # Both pipes at EOF nearly always means the child is on its way
+            # out; give it a moment so `onTerminate` fires this tick rather
+            # than a later one. Do this exactly once per process: the odd
+            # child that closes its streams but keeps running would
+            # otherwise stall the main thread for the full timeout on every
+            # tick. Later ticks rely on the plain `poll()` above.
+            self._eofWaitDone = True
+            try:
+                retCode = self._process.wait(timeout=0.1)
+            except TimeoutExpired:
+                pass
         if retCode is not None:  # process has exited?
-            # unbind the idle loop used to poll the subprocess
-            self.parent.Bind(wx.EVT_IDLE, None)
+            # no need to keep polling this job
+            Job._sharedPollTimer.unregister(self)
             time.sleep(0.1)  # give time for pipes to flush
             wx.CallAfter(self.onTerminate, retCode)
 
-        # get data from pipes
-        self._readPipes()
+        # get data from pipes, using the specialized impl directly
+        self._readPipesImpl()
 
     def onTerminate(self, exitCode):
         """Called when the process exits.
@@ -622,23 +1279,32 @@ class Job:
         called.
 
         """
-        # if self._pollTimer.IsRunning():
-        #     self._pollTimer.Stop()
+        if self._process is None:
+            return  # already cleaned up, e.g. `terminate()` racing `poll()`
+
+        self._readPipes(flush=True)  # read remaining data
 
-        self._readPipes()  # read remaining data
+        # stop servicing this job's pipes
+        if self._usingMux:
+            mux = _PipeMultiplexer.getInstance()
+            mux.unregister(self._stdoutReader)
+            mux.unregister(self._stderrReader)
+            self._usingMux = False
 
         # catch remaining data
         for i, p in enumerate((self._stdoutReader, self._stderrReader)):
             subprocPipeFd = p.stop()
-            subprocPipeFd.flush()
-            pipeBytes = subprocPipeFd.read()
-            wx.CallAfter(
-                self._inputCallback if i == 0 else self._errorCallback,
-                pipeBytes)
-
-        # flush remaining bytes, write out
-        self._stdoutReader.join(timeout=1)
-        self._stderrReader.join(timeout=1)
+            try:
+                pipeBytes = subprocPipeFd.read()
+            except (OSError, ValueError):
+                pipeBytes = None  # pipe already closed
+
+            if pipeBytes:
+                if self._text:
+                    pipeBytes = pipeBytes.decode('utf-8', errors='replace')
+                wx.CallAfter(
+                    self._inputCallback if i == 0 else self._errorCallback,
+                    pipeBytes)
 
         # if callback is provided, else nop
         if self._terminateCallback is not None:
@@ -647,14 +1313,6 @@ class Job:
         self._process = self._pid = None  # reset
         # self._flags = 0
 
-    # def onNotify(self):
-    #     """Called when the polling timer elapses.
-    #
-    #     Default action is to read input and error streams and broadcast any data
-    #     to user defined callbacks (if `poll()` has not been overwritten).
-    #     """
-    #     self.poll()
-
     def __del__(self):
         """Called when the object is garbage collected or deleted."""
         try: